@@ -8,9 +8,13 @@ This module implements 10 chart visualizations for customer churn analysis.
 """
 
 # TASK 1: Imports & Configuration
+import importlib.util
+import os
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Charts are only saved to file; no GUI backend in the workers
 import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 from pathlib import Path
 
@@ -20,13 +24,43 @@ RETAIN_GREEN = '#2ecc71'
 NEUTRAL_BLUE = '#3498db'
 WARNING_ORANGE = '#f39c12'
 
+# Bar palettes shared by the standalone charts and the dashboard panels
+CONTRACT_COLORS = [CHURN_RED, '#ff6b6b', '#ff8787']
+SUPPORT_COLORS = ['#f1c40f', '#e67e22', WARNING_ORANGE, '#e74c3c', CHURN_RED]
+
+# Default color cycle: seaborn's 6-color "husl" palette, set without importing seaborn
+HUSL_PALETTE = ['#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4']
+
+# Column dtypes parsed directly by the CSV reader (smallest type that fits);
+# the integer types are nullable so a blank field loads as <NA>
+COLUMN_DTYPES = {
+    'age': 'Int16',
+    'tenure_months': 'Int16',
+    'monthly_charges': 'float32',
+    'total_charges': 'float32',
+    'num_products': 'Int8',
+    'num_support_calls': 'Int8',
+    'churned': 'Int8',
+    'contract_type': 'category',
+    'payment_method': 'category',
+}
+
+# Whitespace-only fields are read as missing too
+NA_VALUES = [' ']
+
+# Optional PyArrow support: multi-threaded CSV parsing and a Parquet cache
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+CSV_ENGINE = 'pyarrow' if HAS_PYARROW else 'c'
+
 # Output configuration
 OUTPUT_DIR = Path('outputs')
 OUTPUT_DIR.mkdir(exist_ok=True)
+PNG_COMPRESS_LEVEL = 1  # zlib level: fast encode, slightly larger files
 
 # Matplotlib style configuration
 plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("husl")
+plt.rcParams['axes.prop_cycle'] = plt.cycler(color=HUSL_PALETTE)
+plt.rcParams['text.parse_math'] = False  # No chart text uses mathtext; draw '$' literally
 
 
 # TASK 2: Data Loading & Validation
@@ -42,12 +76,42 @@ def load_data(filepath: str) -> pd.DataFrame:
         
     Raises:
         FileNotFoundError: If the dataset file doesn't exist
-        ValueError: If required columns are missing
+        ValueError: If required columns are missing or a numeric column
+            holds non-numeric values
     """
     print(f"Loading data from: {filepath}")
     
-    # Read CSV file
-    df = pd.read_csv(filepath)
+    # Reuse the typed Parquet copy written by an earlier run only if it was
+    # built from a CSV of exactly this size and mtime; any change, including a
+    # replacement carrying an older mtime (cp -p, rsync -t, unzip), rebuilds it
+    data_path = Path(filepath)
+    cache_path = data_path.with_suffix('.parquet')
+    csv_stat = data_path.stat()
+    source_key = f"{csv_stat.st_size}:{csv_stat.st_mtime_ns}"
+    use_cache = HAS_PYARROW and cache_path.exists()
+    
+    # An unreadable cache, or one written from another CSV or under an older
+    # COLUMN_DTYPES, is ignored and rebuilt from the CSV
+    df = None
+    if use_cache:
+        try:
+            df = pd.read_parquet(cache_path)
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable Parquet cache: {e}")
+        else:
+            stale = df.attrs.get('source_key') != source_key or any(
+                column not in df.columns or str(df[column].dtype) != dtype
+                for column, dtype in COLUMN_DTYPES.items()
+            )
+            if stale:
+                print("Warning: Parquet cache is out of date, rebuilding")
+                df = None
+        use_cache = df is not None
+    
+    # Read CSV file, parsing columns straight into their final dtypes
+    if df is None:
+        df = pd.read_csv(data_path, dtype=COLUMN_DTYPES, na_values=NA_VALUES,
+                         engine=CSV_ENGINE)
     
     # Expected columns
     expected_columns = [
@@ -61,20 +125,30 @@ def load_data(filepath: str) -> pd.DataFrame:
     if missing_cols:
         raise ValueError(f"Missing required columns: {missing_cols}")
     
-    # Check for missing values
-    null_counts = df.isnull().sum()
-    if null_counts.sum() > 0:
+    # Cache the validated, typed frame for the next run; write to a temp
+    # file and swap it in so an interrupted run never leaves a partial cache
+    if HAS_PYARROW and not use_cache:
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            df.attrs['source_key'] = source_key
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            print(f"Warning: Could not write Parquet cache: {e}")
+    
+    # Check for missing values; per-column counts are only built when any exist
+    if df.isna().to_numpy().any():
+        null_counts = df.isna().sum()
         print(f"Warning: Found {null_counts.sum()} missing values")
         print(null_counts[null_counts > 0])
     
-    # Convert data types
-    df['age'] = pd.to_numeric(df['age'], errors='coerce')
-    df['tenure_months'] = pd.to_numeric(df['tenure_months'], errors='coerce')
-    df['monthly_charges'] = pd.to_numeric(df['monthly_charges'], errors='coerce')
-    df['total_charges'] = pd.to_numeric(df['total_charges'], errors='coerce')
-    df['num_products'] = pd.to_numeric(df['num_products'], errors='coerce')
-    df['num_support_calls'] = pd.to_numeric(df['num_support_calls'], errors='coerce')
-    df['churned'] = pd.to_numeric(df['churned'], errors='coerce')
+    # Rows without a churn outcome cannot be charted; other missing values
+    # are left out of each aggregate
+    no_outcome = df['churned'].isna()
+    if no_outcome.any():
+        print(f"Warning: Dropping {no_outcome.sum()} row(s) with no churn outcome")
+        df = df[~no_outcome].reset_index(drop=True)
     
     # Print data summary
     print(f"\nDataset Summary:")
@@ -87,25 +161,221 @@ def load_data(filepath: str) -> pd.DataFrame:
     return df
 
 
+def group_codes(values: pd.Series) -> tuple:
+    """
+    Map a column to dense integer group codes in groupby's sorted order.
+    
+    Args:
+        values: Categorical or plain column
+        
+    Returns:
+        tuple: (codes, labels) where labels[code] is the group value;
+        missing values get code -1
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.to_numpy(), values.cat.categories
+    return pd.factorize(values, sort=True)
+
+
+def count_table(df: pd.DataFrame, row: str, column: str) -> pd.DataFrame:
+    """
+    Count customers per (row, column) value pair as a 2-D table.
+    
+    Args:
+        df: Customer churn dataset
+        row: Column whose values label the rows
+        column: Column whose values label the columns
+        
+    Returns:
+        pd.DataFrame: Counts for the value pairs that occur, with empty rows
+        and columns dropped (like groupby().size().unstack(fill_value=0))
+    """
+    # Pack both codes into one key and count every cell with a single bincount
+    row_codes, row_labels = group_codes(df[row])
+    col_codes, col_labels = group_codes(df[column])
+    valid = (row_codes >= 0) & (col_codes >= 0)
+    cells = np.bincount(
+        row_codes[valid] * len(col_labels) + col_codes[valid],
+        minlength=len(row_labels) * len(col_labels)
+    ).reshape(len(row_labels), len(col_labels))
+    
+    rows, cols = cells.sum(axis=1) > 0, cells.sum(axis=0) > 0
+    return pd.DataFrame(
+        cells[rows][:, cols],
+        index=pd.Index(row_labels[rows], name=row),
+        columns=pd.Index(col_labels[cols], name=column)
+    )
+
+
+def churn_rate_tables(df: pd.DataFrame, columns: list) -> dict:
+    """
+    Aggregate churned/total counts and churn rate per value of each column.
+    
+    All columns are counted together in one joint pass, then each table is
+    the marginal of that small joint count over the other columns.
+    
+    Args:
+        df: Customer churn dataset
+        columns: Columns to group by
+        
+    Returns:
+        dict: Column name -> pd.DataFrame of churned, total and churn_rate
+        indexed by column value
+    """
+    # Group codes per column; a missing value gets its own trailing slot so
+    # it drops out of its own table but still counts towards the others
+    all_codes, all_labels = [], []
+    for column in columns:
+        codes, labels = group_codes(df[column])
+        all_codes.append(np.where(codes >= 0, codes, len(labels)))
+        all_labels.append(labels)
+    shape = tuple(len(labels) + 1 for labels in all_labels)
+    
+    # Joint totals and churned counts: two bincount passes over one packed key
+    key = np.ravel_multi_index(all_codes, shape)
+    churned = df['churned'].to_numpy(dtype=np.int8)
+    size = int(np.prod(shape))
+    total = np.bincount(key, minlength=size).reshape(shape)
+    churned_count = np.bincount(key, weights=churned, minlength=size).reshape(shape)
+    
+    tables = {}
+    for axis, (column, labels) in enumerate(zip(columns, all_labels)):
+        other_axes = tuple(a for a in range(len(columns)) if a != axis)
+        column_total = total.sum(axis=other_axes)[:-1]
+        column_churned = churned_count.sum(axis=other_axes)[:-1]
+        table = pd.DataFrame(
+            {'churned': column_churned.astype(np.int64), 'total': column_total},
+            index=pd.Index(labels, name=column)
+        )
+        table['churn_rate'] = (table['churned'] / table['total']) * 100
+        tables[column] = table
+    return tables
+
+
+def split_present(values: pd.Series, churn_mask: np.ndarray) -> tuple:
+    """
+    Split a numeric column by churn status, leaving out missing values.
+    
+    Args:
+        values: Numeric column, possibly nullable
+        churn_mask: Boolean ndarray, True for churned customers
+        
+    Returns:
+        tuple: (retained, churned) ndarrays without missing entries
+    """
+    present = values.notna().to_numpy()
+    return (values[present & ~churn_mask].to_numpy(),
+            values[present & churn_mask].to_numpy())
+
+
+def precompute_aggregates(df: pd.DataFrame) -> dict:
+    """
+    Compute everything the charts plot, once, so they never touch df.
+    
+    Args:
+        df: Customer churn dataset
+        
+    Returns:
+        dict: Small DataFrames keyed 'contract', 'support', 'products',
+        'payment' and 'contract_product'; 'churn_counts' ([retained,
+        churned] ndarray); 'tenure' histogram (edges, retained counts,
+        churned counts); and 'age' / 'charges' as (retained, churned)
+        ndarray pairs
+    """
+    rates = churn_rate_tables(df, ['contract_type', 'num_support_calls', 'num_products'])
+    # Keep both outcome columns even when one never occurs
+    payment = count_table(df, 'payment_method', 'churned')
+    payment = payment.reindex(columns=[0, 1], fill_value=0)
+    payment.columns = ['Retained', 'Churned']
+    contract_product = count_table(df, 'contract_type', 'num_products')
+    churn_mask = df['churned'].to_numpy(dtype=np.int8) == 1
+    
+    # Contract types ordered by churn rate, highest first (a stable argsort on
+    # the few rates rather than DataFrame.sort_values)
+    contract = rates['contract_type']
+    contract = contract.iloc[np.argsort(-contract['churn_rate'].to_numpy(), kind='stable')]
+    
+    # Numeric columns split by churn status, with missing values left out
+    tenure = split_present(df['tenure_months'], churn_mask)
+    age = split_present(df['age'], churn_mask)
+    charges = split_present(df['monthly_charges'], churn_mask)
+    
+    # Tenure: count each churn status on one shared set of bins
+    edges = np.histogram_bin_edges(np.concatenate(tenure), bins=8)
+    tenure_hist = (
+        edges,
+        np.histogram(tenure[0], edges)[0],
+        np.histogram(tenure[1], edges)[0],
+    )
+    
+    return {
+        'contract': contract,
+        'support': rates['num_support_calls'],
+        'products': rates['num_products'],
+        'payment': payment,
+        'contract_product': contract_product,
+        'churn_counts': np.bincount(churn_mask, minlength=2),
+        'tenure': tenure_hist,
+        'age': age,
+        'charges': charges,
+    }
+
+
 # TASK 3: Chart Generation Functions
 
-def create_churn_pie_chart(df: pd.DataFrame) -> str:
+_figure = None
+
+
+def new_figure(figsize: tuple, nrows: int = 1, ncols: int = 1) -> tuple:
+    """
+    Return a blank figure and its axes, reusing one Figure per process.
+    
+    Args:
+        figsize: Figure size in inches
+        nrows: Number of subplot rows
+        ncols: Number of subplot columns
+        
+    Returns:
+        tuple: (figure, axes) as returned by plt.subplots
+    """
+    global _figure
+    if _figure is None:
+        # Constrained layout is solved as part of the save render itself,
+        # replacing a separate tight_layout() pass per chart
+        _figure = plt.figure(layout='constrained')
+    _figure.clear()
+    _figure.set_size_inches(figsize)
+    return _figure, _figure.subplots(nrows, ncols)
+
+
+def save_chart(fig, output_path: Path) -> None:
+    """
+    Write a chart as PNG at 100 DPI with fast zlib compression.
+    
+    Args:
+        fig: Figure returned by new_figure
+        output_path: Destination PNG file
+    """
+    fig.savefig(output_path, dpi=100, pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
+
+
+def create_churn_pie_chart(agg: dict) -> str:
     """
     TASK 3.1: Generate overall churn distribution pie chart.
     
     Args:
-        df: Customer churn dataset
+        agg: Shared aggregates from precompute_aggregates
         
     Returns:
         str: Path to the saved chart
     """
-    # Data preparation
-    churn_counts = df['churned'].value_counts().sort_index()
+    # Data preparation - shared retained/churned counts
+    churn_counts = agg['churn_counts']
     labels = ['Retained', 'Churned']
     colors = [RETAIN_GREEN, CHURN_RED]
     
     # Chart creation
-    fig, ax = plt.subplots(figsize=(6, 4))
+    fig, ax = new_figure((6, 4))
     wedges, texts, autotexts = ax.pie(
         churn_counts,
         labels=labels,
@@ -116,140 +386,110 @@ def create_churn_pie_chart(df: pd.DataFrame) -> str:
     
     # Styling
     ax.set_title('Customer Churn Distribution', fontsize=14, fontweight='bold')
-    plt.legend(loc='lower center', bbox_to_anchor=(0.5, -0.1), ncol=2)
+    ax.legend(loc='lower center', bbox_to_anchor=(0.5, -0.1), ncol=2)
     
     # Save file
     output_path = OUTPUT_DIR / '01_churn_pie.png'
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    save_chart(fig, output_path)
     
     print(f"  [OK] Saved: {output_path.name}")
     return str(output_path)
 
 
-def create_contract_churn_chart(df: pd.DataFrame) -> str:
+def create_contract_churn_chart(agg: dict) -> str:
     """
     TASK 3.2: Generate churn rate by contract type bar chart.
     
     Args:
-        df: Customer churn dataset
+        agg: Shared aggregates from precompute_aggregates
         
     Returns:
         str: Path to the saved chart
     """
-    # Data preparation - calculate churn rate by contract type
-    contract_churn = df.groupby('contract_type').agg({
-        'churned': ['sum', 'count']
-    })
-    contract_churn.columns = ['churned', 'total']
-    contract_churn['churn_rate'] = (contract_churn['churned'] / contract_churn['total']) * 100
-    contract_churn = contract_churn.sort_values('churn_rate', ascending=False)
+    # Data preparation - churn rate by contract type, highest first
+    contract_churn = agg['contract']
     
     # Chart creation
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax = new_figure((8, 5))
     bars = ax.bar(
         contract_churn.index,
         contract_churn['churn_rate'],
-        color=[CHURN_RED, '#ff6b6b', '#ff8787']
+        color=CONTRACT_COLORS
     )
     
     # Add value labels on bars
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(
-            bar.get_x() + bar.get_width()/2., height,
-            f'{height:.1f}%',
-            ha='center', va='bottom', fontsize=10
-        )
+    ax.bar_label(bars, fmt='%.1f%%', fontsize=10)
     
     # Styling
     ax.set_title('Churn Rate by Contract Type', fontsize=14, fontweight='bold')
     ax.set_xlabel('Contract Type', fontsize=11)
     ax.set_ylabel('Churn Rate (%)', fontsize=11)
     ax.set_ylim(0, 100)
-    plt.xticks(rotation=15)
-    plt.grid(axis='y', alpha=0.3)
+    ax.tick_params(axis='x', labelrotation=15)
+    ax.grid(axis='y', alpha=0.3)
     
     # Save file
     output_path = OUTPUT_DIR / '02_churn_by_contract.png'
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    save_chart(fig, output_path)
     
     print(f"  [OK] Saved: {output_path.name}")
     return str(output_path)
 
 
-def create_support_calls_chart(df: pd.DataFrame) -> str:
+def create_support_calls_chart(agg: dict) -> str:
     """
     TASK 3.3: Generate churn rate by support calls bar chart.
     
     Args:
-        df: Customer churn dataset
+        agg: Shared aggregates from precompute_aggregates
         
     Returns:
         str: Path to the saved chart
     """
     # Data preparation
-    support_churn = df.groupby('num_support_calls').agg({
-        'churned': ['sum', 'count']
-    })
-    support_churn.columns = ['churned', 'total']
-    support_churn['churn_rate'] = (support_churn['churned'] / support_churn['total']) * 100
+    support_churn = agg['support']
     
     # Chart creation with gradient colors (yellow to red)
-    colors = ['#f1c40f', '#e67e22', WARNING_ORANGE, '#e74c3c', CHURN_RED]
-    
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax = new_figure((8, 5))
     bars = ax.bar(
         support_churn.index,
         support_churn['churn_rate'],
-        color=colors[:len(support_churn)]
+        color=SUPPORT_COLORS[:len(support_churn)]
     )
     
     # Add value labels
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(
-            bar.get_x() + bar.get_width()/2., height,
-            f'{height:.1f}%',
-            ha='center', va='bottom', fontsize=10
-        )
+    ax.bar_label(bars, fmt='%.1f%%', fontsize=10)
     
     # Styling
     ax.set_title('Churn Rate by Number of Support Calls', fontsize=14, fontweight='bold')
     ax.set_xlabel('Number of Support Calls', fontsize=11)
     ax.set_ylabel('Churn Rate (%)', fontsize=11)
     ax.set_ylim(0, max(support_churn['churn_rate']) * 1.2)
-    plt.grid(axis='y', alpha=0.3)
+    ax.grid(axis='y', alpha=0.3)
     
     # Save file
     output_path = OUTPUT_DIR / '05_churn_by_support.png'
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    save_chart(fig, output_path)
     
     print(f"  [OK] Saved: {output_path.name}")
     return str(output_path)
 
 
-def create_payment_method_chart(df: pd.DataFrame) -> str:
+def create_payment_method_chart(agg: dict) -> str:
     """
     TASK 3.4: Generate churn by payment method grouped bar chart.
     
     Args:
-        df: Customer churn dataset
+        agg: Shared aggregates from precompute_aggregates
         
     Returns:
         str: Path to the saved chart
     """
     # Data preparation - count by payment method and churn status
-    payment_churn = df.groupby(['payment_method', 'churned']).size().unstack(fill_value=0)
-    payment_churn.columns = ['Retained', 'Churned']
+    payment_churn = agg['payment']
     
     # Chart creation
-    fig, ax = plt.subplots(figsize=(9, 5))
+    fig, ax = new_figure((9, 5))
     x = np.arange(len(payment_churn.index))
     width = 0.35
     
@@ -265,44 +505,36 @@ def create_payment_method_chart(df: pd.DataFrame) -> str:
     ax.set_xticks(x)
     ax.set_xticklabels(payment_churn.index, rotation=15)
     ax.legend(loc='upper right')
-    plt.grid(axis='y', alpha=0.3)
+    ax.grid(axis='y', alpha=0.3)
     
     # Save file
     output_path = OUTPUT_DIR / '03_churn_by_payment.png'
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    save_chart(fig, output_path)
     
     print(f"  [OK] Saved: {output_path.name}")
     return str(output_path)
 
 
-def create_products_chart(df: pd.DataFrame) -> str:
+def create_products_chart(agg: dict) -> str:
     """
     TASK 3.5: Generate churn rate by number of products bar chart.
     
     Args:
-        df: Customer churn dataset
+        agg: Shared aggregates from precompute_aggregates
         
     Returns:
         str: Path to the saved chart
     """
     # Data preparation
-    products_churn = df.groupby('num_products').agg({
-        'churned': ['sum', 'count']
-    })
-    products_churn.columns = ['churned', 'total']
-    products_churn['churn_rate'] = (products_churn['churned'] / products_churn['total']) * 100
+    products_churn = agg['products']
     
     # Chart creation with green gradient (darker = lower churn)
     # Reverse color intensity - lower churn = darker green
-    max_rate = products_churn['churn_rate'].max()
-    colors = []
-    for rate in products_churn['churn_rate']:
-        intensity = 1 - (rate / max_rate) * 0.5  # 0.5 to 1.0 range
-        colors.append((0.18 * intensity, 0.8 * intensity, 0.44 * intensity))
+    rates = products_churn['churn_rate'].to_numpy()
+    intensity = 1 - (rates / rates.max()) * 0.5  # 0.5 to 1.0 range
+    colors = np.outer(intensity, (0.18, 0.8, 0.44))
     
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax = new_figure((8, 5))
     bars = ax.bar(
         products_churn.index,
         products_churn['churn_rate'],
@@ -310,53 +542,45 @@ def create_products_chart(df: pd.DataFrame) -> str:
     )
     
     # Add value labels
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(
-            bar.get_x() + bar.get_width()/2., height,
-            f'{height:.1f}%',
-            ha='center', va='bottom', fontsize=10
-        )
+    ax.bar_label(bars, fmt='%.1f%%', fontsize=10)
     
     # Styling
     ax.set_title('Churn Rate by Product Portfolio Size', fontsize=14, fontweight='bold')
     ax.set_xlabel('Number of Products', fontsize=11)
     ax.set_ylabel('Churn Rate (%)', fontsize=11)
     ax.set_ylim(0, max(products_churn['churn_rate']) * 1.2)
-    plt.grid(axis='y', alpha=0.3)
+    ax.grid(axis='y', alpha=0.3)
     
     # Save file
     output_path = OUTPUT_DIR / '04_churn_by_products.png'
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    save_chart(fig, output_path)
     
     print(f"  [OK] Saved: {output_path.name}")
     return str(output_path)
 
 
-def create_tenure_histogram(df: pd.DataFrame) -> str:
+def create_tenure_histogram(agg: dict) -> str:
     """
     TASK 3.6: Generate tenure distribution comparison histogram.
     
     Args:
-        df: Customer churn dataset
+        agg: Shared aggregates from precompute_aggregates
         
     Returns:
         str: Path to the saved chart
     """
-    # Data preparation - separate by churn status
-    tenure_retained = df[df['churned'] == 0]['tenure_months']
-    tenure_churned = df[df['churned'] == 1]['tenure_months']
+    # Data preparation - per-status counts on shared bins
+    edges, retained_counts, churned_counts = agg['tenure']
+    widths = np.diff(edges)
     
     # Chart creation
-    fig, ax = plt.subplots(figsize=(9, 5))
+    fig, ax = new_figure((9, 5))
     
     # Overlapping histograms with transparency
-    ax.hist(tenure_retained, bins=8, alpha=0.6, color=NEUTRAL_BLUE, 
-            label='Retained', edgecolor='black')
-    ax.hist(tenure_churned, bins=8, alpha=0.6, color=CHURN_RED,
-            label='Churned', edgecolor='black')
+    ax.bar(edges[:-1], retained_counts, width=widths, align='edge', alpha=0.6,
+           color=NEUTRAL_BLUE, label='Retained', edgecolor='black')
+    ax.bar(edges[:-1], churned_counts, width=widths, align='edge', alpha=0.6,
+           color=CHURN_RED, label='Churned', edgecolor='black')
     
     # Styling
     ax.set_title('Tenure Distribution: Churned vs Retained Customers', 
@@ -364,35 +588,33 @@ def create_tenure_histogram(df: pd.DataFrame) -> str:
     ax.set_xlabel('Tenure (months)', fontsize=11)
     ax.set_ylabel('Customer Count', fontsize=11)
     ax.legend(loc='upper right')
-    plt.grid(axis='y', alpha=0.3)
+    ax.grid(axis='y', alpha=0.3)
     
     # Save file
     output_path = OUTPUT_DIR / '07_tenure_histogram.png'
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    save_chart(fig, output_path)
     
     print(f"  [OK] Saved: {output_path.name}")
     return str(output_path)
 
 
-def create_age_boxplot(df: pd.DataFrame) -> str:
+def create_age_boxplot(agg: dict) -> str:
     """
     TASK 3.7: Generate age distribution comparison box plot.
     
     Args:
-        df: Customer churn dataset
+        agg: Shared aggregates from precompute_aggregates
         
     Returns:
         str: Path to the saved chart
     """
     # Data preparation
-    age_data = [df[df['churned'] == 0]['age'], df[df['churned'] == 1]['age']]
+    age_data = list(agg['age'])
     labels = ['Retained', 'Churned']
     colors = [RETAIN_GREEN, CHURN_RED]
     
     # Chart creation
-    fig, ax = plt.subplots(figsize=(7, 5))
+    fig, ax = new_figure((7, 5))
     bp = ax.boxplot(age_data, labels=labels, patch_artist=True,
                     showmeans=True, meanline=True)
     
@@ -406,49 +628,47 @@ def create_age_boxplot(df: pd.DataFrame) -> str:
                  fontsize=14, fontweight='bold')
     ax.set_xlabel('Customer Status', fontsize=11)
     ax.set_ylabel('Age', fontsize=11)
-    plt.grid(axis='y', alpha=0.3)
+    ax.grid(axis='y', alpha=0.3)
     
     # Save file
     output_path = OUTPUT_DIR / '06_age_histogram.png'
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    save_chart(fig, output_path)
     
     print(f"  [OK] Saved: {output_path.name}")
     return str(output_path)
 
 
-def create_charges_violin(df: pd.DataFrame) -> str:
+def create_charges_violin(agg: dict) -> str:
     """
     TASK 3.8: Generate monthly charges distribution violin plot.
     
     Args:
-        df: Customer churn dataset
+        agg: Shared aggregates from precompute_aggregates
         
     Returns:
         str: Path to the saved chart
     """
-    # Data preparation
-    df_plot = df.copy()
-    df_plot['Status'] = df_plot['churned'].map({0: 'Retained', 1: 'Churned'})
+    # Data preparation - charges split by churn status; a status with no
+    # customers (e.g. nobody retained) has no distribution to draw
+    positions = [i for i, values in enumerate(agg['charges']) if len(values)]
     
     # Chart creation
-    fig, ax = plt.subplots(figsize=(7, 5))
+    fig, ax = new_figure((7, 5))
     
     # Create violin plot
-    parts = ax.violinplot(
-        [df[df['churned'] == 0]['monthly_charges'],
-         df[df['churned'] == 1]['monthly_charges']],
-        positions=[0, 1],
-        showmeans=True,
-        showmedians=True
-    )
-    
-    # Color the violins
-    for i, pc in enumerate(parts['bodies']):
-        color = RETAIN_GREEN if i == 0 else CHURN_RED
-        pc.set_facecolor(color)
-        pc.set_alpha(0.7)
+    if positions:
+        parts = ax.violinplot(
+            [agg['charges'][i] for i in positions],
+            positions=positions,
+            showmeans=True,
+            showmedians=True
+        )
+        
+        # Color the violins
+        for i, pc in zip(positions, parts['bodies']):
+            color = RETAIN_GREEN if i == 0 else CHURN_RED
+            pc.set_facecolor(color)
+            pc.set_alpha(0.7)
     
     # Styling
     ax.set_title('Monthly Charges Distribution: Churned vs Retained',
@@ -457,33 +677,31 @@ def create_charges_violin(df: pd.DataFrame) -> str:
     ax.set_ylabel('Monthly Charges ($)', fontsize=11)
     ax.set_xticks([0, 1])
     ax.set_xticklabels(['Retained', 'Churned'])
-    plt.grid(axis='y', alpha=0.3)
+    ax.grid(axis='y', alpha=0.3)
     
     # Save file
     output_path = OUTPUT_DIR / '08_charges_boxplot.png'
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    save_chart(fig, output_path)
     
     print(f"  [OK] Saved: {output_path.name}")
     return str(output_path)
 
 
-def create_contract_product_stack(df: pd.DataFrame) -> str:
+def create_contract_product_stack(agg: dict) -> str:
     """
     TASK 3.9: Generate contract type × product count stacked bar chart.
     
     Args:
-        df: Customer churn dataset
+        agg: Shared aggregates from precompute_aggregates
         
     Returns:
         str: Path to the saved chart
     """
     # Data preparation - pivot table for stacked bar
-    contract_product = df.groupby(['contract_type', 'num_products']).size().unstack(fill_value=0)
+    contract_product = agg['contract_product']
     
     # Chart creation
-    fig, ax = plt.subplots(figsize=(9, 6))
+    fig, ax = new_figure((9, 6))
     
     # Stacked bar chart
     contract_product.plot(kind='bar', stacked=True, ax=ax, 
@@ -495,48 +713,43 @@ def create_contract_product_stack(df: pd.DataFrame) -> str:
     ax.set_xlabel('Contract Type', fontsize=11)
     ax.set_ylabel('Customer Count', fontsize=11)
     ax.legend(title='Products', loc='upper right', ncol=1)
-    plt.xticks(rotation=15)
-    plt.grid(axis='y', alpha=0.3)
+    ax.tick_params(axis='x', labelrotation=15)
+    ax.grid(axis='y', alpha=0.3)
     
     # Save file
     output_path = OUTPUT_DIR / '09_contract_distribution.png'
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    save_chart(fig, output_path)
     
     print(f"  [OK] Saved: {output_path.name}")
     return str(output_path)
 
 
-def create_dashboard(df: pd.DataFrame) -> str:
+def create_dashboard(agg: dict) -> str:
     """
     TASK 3.10: Generate executive dashboard with 2×2 grid of charts.
     
     Args:
-        df: Customer churn dataset
+        agg: Shared aggregates from precompute_aggregates
         
     Returns:
         str: Path to the saved chart
     """
+    
     # Create figure with 2×2 subplots
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 9))
+    fig, ((ax1, ax2), (ax3, ax4)) = new_figure((12, 9), nrows=2, ncols=2)
     fig.suptitle('Customer Churn Analysis Dashboard', 
                  fontsize=16, fontweight='bold')
     
     # Chart 1: Churn pie (top-left)
-    churn_counts = df['churned'].value_counts().sort_index()
-    ax1.pie(churn_counts, labels=['Retained', 'Churned'], 
+    ax1.pie(agg['churn_counts'], labels=['Retained', 'Churned'], 
             colors=[RETAIN_GREEN, CHURN_RED],
             autopct='%1.1f%%', startangle=90)
     ax1.set_title('Overall Churn Distribution', fontsize=12)
     
     # Chart 2: Contract churn rates (top-right)
-    contract_churn = df.groupby('contract_type').agg({'churned': ['sum', 'count']})
-    contract_churn.columns = ['churned', 'total']
-    contract_churn['churn_rate'] = (contract_churn['churned'] / contract_churn['total']) * 100
-    contract_churn = contract_churn.sort_values('churn_rate', ascending=False)
+    contract_churn = agg['contract']
     bars2 = ax2.bar(range(len(contract_churn)), contract_churn['churn_rate'],
-                    color=[CHURN_RED, '#ff6b6b', '#ff8787'])
+                    color=CONTRACT_COLORS)
     ax2.set_xticks(range(len(contract_churn)))
     ax2.set_xticklabels(contract_churn.index, rotation=15, fontsize=9)
     ax2.set_title('Churn Rate by Contract', fontsize=12)
@@ -544,21 +757,16 @@ def create_dashboard(df: pd.DataFrame) -> str:
     ax2.grid(axis='y', alpha=0.3)
     
     # Chart 3: Support calls churn (bottom-left)
-    support_churn = df.groupby('num_support_calls').agg({'churned': ['sum', 'count']})
-    support_churn.columns = ['churned', 'total']
-    support_churn['churn_rate'] = (support_churn['churned'] / support_churn['total']) * 100
-    colors = ['#f1c40f', '#e67e22', WARNING_ORANGE, '#e74c3c', CHURN_RED]
+    support_churn = agg['support']
     ax3.bar(support_churn.index, support_churn['churn_rate'],
-            color=colors[:len(support_churn)])
+            color=SUPPORT_COLORS[:len(support_churn)])
     ax3.set_title('Churn by Support Calls', fontsize=12)
     ax3.set_xlabel('Support Calls', fontsize=10)
     ax3.set_ylabel('Churn Rate (%)', fontsize=10)
     ax3.grid(axis='y', alpha=0.3)
     
     # Chart 4: Products churn (bottom-right)
-    products_churn = df.groupby('num_products').agg({'churned': ['sum', 'count']})
-    products_churn.columns = ['churned', 'total']
-    products_churn['churn_rate'] = (products_churn['churned'] / products_churn['total']) * 100
+    products_churn = agg['products']
     ax4.bar(products_churn.index, products_churn['churn_rate'],
             color=['#95a5a6', '#7f8c8d', RETAIN_GREEN, '#27ae60', '#229954'])
     ax4.set_title('Churn by Product Count', fontsize=12)
@@ -568,9 +776,7 @@ def create_dashboard(df: pd.DataFrame) -> str:
     
     # Save file
     output_path = OUTPUT_DIR / '10_payment_distribution.png'
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=100, bbox_inches='tight')
-    plt.close()
+    save_chart(fig, output_path)
     
     print(f"  [OK] Saved: {output_path.name}")
     return str(output_path)
@@ -594,28 +800,33 @@ def main():
         print(f"[ERROR] Failed to load data: {e}")
         return
     
-    # Track successfully created charts
-    charts_created = []
+    # Everything the charts plot, computed once; workers only receive this
+    agg = precompute_aggregates(df)
     
     print("\n" + "="*60)
     print("  Generating Charts (All 10 Visualizations)")
     print("="*60)
     
-    # Generate all 10 charts
+    chart_functions = [
+        create_churn_pie_chart,
+        create_contract_churn_chart,
+        create_payment_method_chart,
+        create_products_chart,
+        create_support_calls_chart,
+        create_age_boxplot,
+        create_tenure_histogram,
+        create_charges_violin,
+        create_contract_product_stack,
+        create_dashboard,
+    ]
+    
+    # Generate all 10 charts - they are independent, so render them in
+    # parallel worker processes; results keep the order above
     try:
-        print("\nPart 1: Basic Charts (1-5)")
-        charts_created.append(create_churn_pie_chart(df))
-        charts_created.append(create_contract_churn_chart(df))
-        charts_created.append(create_payment_method_chart(df))
-        charts_created.append(create_products_chart(df))
-        charts_created.append(create_support_calls_chart(df))
-        
-        print("\nPart 2: Distribution Charts (6-10)")
-        charts_created.append(create_age_boxplot(df))
-        charts_created.append(create_tenure_histogram(df))
-        charts_created.append(create_charges_violin(df))
-        charts_created.append(create_contract_product_stack(df))
-        charts_created.append(create_dashboard(df))
+        workers = min(len(chart_functions), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(fn, agg) for fn in chart_functions]
+            charts_created = [future.result() for future in futures]
     except Exception as e:
         print(f"\n[ERROR] Chart generation failed: {e}")
         import traceback